@@ -1,22 +1,21 @@
 from __future__ import annotations
 
 import pickle
-import selectors
 from collections import deque
 from contextlib import AsyncExitStack
 from functools import partial
-from itertools import chain
 from typing import (
     Any,
     Callable,
-    NamedTuple,
     cast,
 )
 
 from anyio import (
+    CancelScope,
     Event,
     TASK_STATUS_IGNORED,
     create_task_group,
+    move_on_after,
     sleep,
     wait_readable,
 )
@@ -27,34 +26,64 @@ import zmq
 from zmq import EVENTS, POLLIN, POLLOUT
 from zmq.utils import jsonapi
 
+# maximum number of ready events _handle_events drains in one task
+# before re-scheduling itself, for fairness with other tasks
+_EVENTS_BATCH = 32
+
+# evaluated once here instead of per message in _add_recv_event/_add_send_event
+_HAS_RCVTIMEO = hasattr(zmq, "RCVTIMEO")
+_HAS_SNDTIMEO = hasattr(zmq, "SNDTIMEO")
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+
 try:
     DEFAULT_PROTOCOL = pickle.DEFAULT_PROTOCOL
 except AttributeError:
     DEFAULT_PROTOCOL = pickle.HIGHEST_PROTOCOL
 
 
-class _FutureEvent(NamedTuple):
-    future: Future
-    kind: str
-    kwargs: dict
-    msg: Any
-    timer: Any
+def _json_dumps(obj: Any, **kwargs) -> bytes:
+    """Serialize an object to JSON bytes, with orjson when available
+
+    orjson doesn't accept stdlib json keyword arguments, so any keyword
+    arguments go to pyzmq's jsonapi. orjson is also stricter than stdlib
+    json (e.g. non-str dict keys, ints beyond 64 bits), so payloads it
+    rejects fall back to jsonapi as well.
+    """
+    if _HAS_ORJSON and not kwargs:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return jsonapi.dumps(obj, **kwargs)
 
 
-class Poller(zmq.Poller):
-    """Poller that returns a Future on poll, instead of blocking."""
+def _json_loads(buf: bytes, **kwargs) -> Any:
+    """Deserialize JSON bytes, with orjson when available
 
-    raw_sockets: list[Any]
+    orjson rejects the NaN/Infinity tokens stdlib json emits, so
+    buffers it cannot decode fall back to jsonapi.
+    """
+    if _HAS_ORJSON and not kwargs:
+        try:
+            return orjson.loads(buf)
+        except ValueError:
+            pass
+    return jsonapi.loads(buf, **kwargs)
 
-    def _watch_raw_socket(self, socket: Any, evt: int, f: Callable) -> None:
-        """Schedule callback for a raw socket"""
-        raise NotImplementedError()
 
-    def _unwatch_raw_sockets(self, *sockets: Any) -> None:
-        """Unschedule callback for a raw socket"""
-        raise NotImplementedError()
+class Poller(zmq.Poller):
+    """Poller that returns a Future on poll, instead of blocking."""
 
     async def apoll(self, timeout=-1, _task_group=None) -> list[tuple[Any, int]]:  # type: ignore
+        if timeout == 0:
+            # non-blocking poll resolves immediately, no timer or watcher needed
+            return super().poll(0)
         if _task_group is None:
             async with create_task_group() as tg:
                 return await self._apoll(timeout, tg)
@@ -63,92 +92,60 @@ class Poller(zmq.Poller):
     async def _apoll(self, timeout, task_group) -> list[tuple[Any, int]]:  # type: ignore
         """Return a poll event"""
         future = Future()
-        if timeout == 0:
-            try:
-                result = super().poll(0)
-            except Exception as e:
-                future.set_exception(e)
-            else:
-                future.set_result(result)
-            return await future.wait()
-
         # register Future to be called as soon as any event is available on any socket
         watcher = Future()
 
-        # watch raw sockets:
-        raw_sockets: list[Any] = []
-
-        def wake_raw(*args):
-            if not watcher.done():
-                watcher.set_result(None)
-
-        watcher.add_done_callback(lambda f: self._unwatch_raw_sockets(*raw_sockets))
-
         for socket, mask in self.sockets:
-            if isinstance(socket, zmq.Socket):
-                if not isinstance(socket, Socket):
-                    # it's a blocking zmq.Socket, wrap it in async
-                    socket = Socket(socket)
-                if mask & zmq.POLLIN:
-                    task_group.start_soon(
-                        partial(socket._add_recv_event, "poll", future=watcher)
-                    )
-                if mask & zmq.POLLOUT:
-                    task_group.start_soon(
-                        partial(socket._add_send_event, "poll", future=watcher)
-                    )
+            if not isinstance(socket, zmq.Socket):
+                raise NotImplementedError("polling non-zmq sockets is not supported")
+            if not isinstance(socket, Socket):
+                # it's a blocking zmq.Socket, wrap it in async
+                socket = Socket(socket)
+            if mask & zmq.POLLIN:
+                task_group.start_soon(
+                    partial(socket._add_recv_event, "poll", future=watcher)
+                )
+            if mask & zmq.POLLOUT:
+                task_group.start_soon(
+                    partial(socket._add_send_event, "poll", future=watcher)
+                )
+
+        def on_poll_ready(f):
+            if future.done():
+                return
+            if watcher.cancelled():
+                try:
+                    future.cancel(raise_exception=False)
+                except RuntimeError:
+                    # RuntimeError may be called during teardown
+                    pass
+                return
+            if watcher.exception():
+                future.set_exception(watcher.exception())
             else:
-                raw_sockets.append(socket)
-                evt = 0
-                if mask & zmq.POLLIN:
-                    evt |= selectors.EVENT_READ
-                if mask & zmq.POLLOUT:
-                    evt |= selectors.EVENT_WRITE
-                self._watch_raw_socket(socket, evt, wake_raw)
-
-            def on_poll_ready(f):
-                if future.done():
-                    return
-                if watcher.cancelled():
-                    try:
-                        future.cancel(raise_exception=False)
-                    except RuntimeError:
-                        # RuntimeError may be called during teardown
-                        pass
-                    return
-                if watcher.exception():
-                    future.set_exception(watcher.exception())
+                try:
+                    result = super(Poller, self).poll(0)
+                except Exception as e:
+                    future.set_exception(e)
                 else:
-                    try:
-                        result = super(Poller, self).poll(0)
-                    except Exception as e:
-                        future.set_exception(e)
-                    else:
-                        future.set_result(result)
-
-            watcher.add_done_callback(on_poll_ready)
-
-            if timeout is not None and timeout > 0:
-                # schedule cancel to fire on poll timeout, if any
-                async def trigger_timeout():
-                    await sleep(1e-3 * timeout)
-                    if not watcher.done():
-                        watcher.set_result(None)
+                    future.set_result(result)
 
-                timeout_handle = create_task(trigger_timeout(), task_group)
+        watcher.add_done_callback(on_poll_ready)
 
-                def cancel_timeout(f):
-                    timeout_handle.cancel(raise_exception=False)
-
-                future.add_done_callback(cancel_timeout)
+        def cancel_watcher(f):
+            if not watcher.done():
+                watcher.cancel(raise_exception=False)
 
-            def cancel_watcher(f):
-                if not watcher.done():
-                    watcher.cancel(raise_exception=False)
+        future.add_done_callback(cancel_watcher)
 
-            future.add_done_callback(cancel_watcher)
+        if timeout is not None and timeout > 0:
+            # resolve with whatever is ready when the poll timeout expires
+            with move_on_after(1e-3 * timeout):
+                return await future.wait()
+            if not watcher.done():
+                watcher.set_result(None)
 
-            return await future.wait()
+        return await future.wait()
 
 
 class _NoTimer:
@@ -158,13 +155,26 @@ class _NoTimer:
 
 
 class Socket(zmq.Socket):
-    _recv_futures = None
-    _send_futures = None
+    _recv_futures: deque[Future] | None = None
+    _recv_kinds: deque
+    _recv_kwargs: deque
+    _recv_timers: deque
+    _recv_columns: tuple[deque, ...]
+    _send_futures: deque[Future] | None = None
+    _send_kinds: deque
+    _send_msgs: deque
+    _send_kwargs: deque
+    _send_timers: deque
+    _send_columns: tuple[deque, ...]
+    _recv_dispatch: dict[str, Callable]
+    _send_dispatch: dict[str, Callable]
+    _poller_cache: dict[int, Poller]
     _state = 0
     _shadow_sock: zmq.Socket
-    _fd = None
+    _fd: int
     _exit_stack = None
     _task_group = None
+    _reader_scope = None
     started = None
 
     def __init__(
@@ -186,8 +196,42 @@ class Socket(zmq.Socket):
             super().__init__(context_or_socket, socket_type, **kwargs)
             self._shadow_sock = zmq.Socket.shadow(self.underlying)
 
+        # bind the shadow socket's methods once, instead of a getattr per message
+        self._recv_dispatch = {
+            "recv": self._shadow_sock.recv,
+            "recv_multipart": self._shadow_sock.recv_multipart,
+        }
+        self._send_dispatch = {
+            "send": self._shadow_sock.send,
+            "send_multipart": self._shadow_sock.send_multipart,
+        }
+        # pollers from apoll, reused across calls with the same flags
+        self._poller_cache = {}
+
+        # pending events are stored as parallel deques (one entry per event),
+        # so that scanning for a pending future only touches the futures deque
         self._recv_futures = deque()
+        self._recv_kinds = deque()
+        self._recv_kwargs = deque()
+        self._recv_timers = deque()
+        self._recv_columns = (
+            self._recv_futures,
+            self._recv_kinds,
+            self._recv_kwargs,
+            self._recv_timers,
+        )
         self._send_futures = deque()
+        self._send_kinds = deque()
+        self._send_msgs = deque()
+        self._send_kwargs = deque()
+        self._send_timers = deque()
+        self._send_columns = (
+            self._send_futures,
+            self._send_kinds,
+            self._send_msgs,
+            self._send_kwargs,
+            self._send_timers,
+        )
         self._state = 0
         self._fd = self._shadow_sock.FD
         self.started = Event()
@@ -195,20 +239,24 @@ class Socket(zmq.Socket):
     def close(self, linger: int | None = None) -> None:
         try:
             if not self.closed and self._fd is not None:
-                event_list: list[_FutureEvent] = list(
-                    chain(self._recv_futures or [], self._send_futures or [])
-                )
-                for event in event_list:
-                    if not event.future.done():
-                        try:
-                            event.future.cancel(raise_exception=False)
-                        except RuntimeError:
-                            # RuntimeError may be called during teardown
-                            pass
+                for futures in (self._recv_futures, self._send_futures):
+                    if not futures:
+                        continue
+                    # snapshot the deque: cancelling removes entries from it
+                    for future in tuple(futures):
+                        if not future.done():
+                            try:
+                                future.cancel(raise_exception=False)
+                            except RuntimeError:
+                                # RuntimeError may be called during teardown
+                                pass
+                self._poller_cache.clear()
             super().close(linger=linger)
         except BaseException:
             pass
 
+        if self._reader_scope is not None:
+            self._reader_scope.cancel()
         if self._task_group is not None:
             self._task_group.cancel_scope.cancel()
 
@@ -229,6 +277,9 @@ class Socket(zmq.Socket):
         track: bool = False,
     ) -> bytes | zmq.Frame:
         self._check_started()
+        if flags & zmq.DONTWAIT:
+            # short-circuit non-blocking calls, no Future needed
+            return self._shadow_sock.recv(flags=flags, copy=copy, track=track)
         return await self._add_recv_event(
             "recv", dict(flags=flags, copy=copy, track=track)
         )
@@ -239,7 +290,7 @@ class Socket(zmq.Socket):
         **kwargs,
     ):
         msg = await self.arecv(flags)
-        return self._deserialize(msg, lambda buf: jsonapi.loads(buf, **kwargs))
+        return _json_loads(cast(bytes, msg), **kwargs)
 
     async def arecv_string(self, flags: int = 0, encoding: str = "utf-8") -> str:
         """Receive a unicode string, as sent by send_string.
@@ -262,7 +313,7 @@ class Socket(zmq.Socket):
             for any of the reasons :func:`Socket.recv` might fail
         """
         msg = await self.arecv(flags=flags)
-        return self._deserialize(msg, lambda buf: buf.decode(encoding))
+        return cast(bytes, msg).decode(encoding)
 
     async def arecv_pyobj(self, flags: int = 0) -> Any:
         """Receive a Python object as a message using pickle to serialize.
@@ -283,7 +334,7 @@ class Socket(zmq.Socket):
             for any of the reasons :func:`~Socket.recv` might fail
         """
         msg = await self.arecv(flags)
-        return self._deserialize(msg, pickle.loads)
+        return pickle.loads(cast(bytes, msg))
 
     async def arecv_serialized(self, deserialize, flags=0, copy=True):
         """Receive a message with a custom deserialization function.
@@ -312,7 +363,7 @@ class Socket(zmq.Socket):
             for any of the reasons :func:`~Socket.recv` might fail
         """
         frames = await self.arecv_multipart(flags=flags, copy=copy)
-        return self._deserialize(frames, deserialize)
+        return deserialize(frames)
 
     async def arecv_multipart(
         self,
@@ -321,6 +372,9 @@ class Socket(zmq.Socket):
         track: bool = False,
     ) -> list[bytes] | list[zmq.Frame]:
         self._check_started()
+        if flags & zmq.DONTWAIT:
+            # short-circuit non-blocking calls, no Future needed
+            return self._shadow_sock.recv_multipart(flags=flags, copy=copy, track=track)
         return await self._add_recv_event(
             "recv_multipart", dict(flags=flags, copy=copy, track=track)
         )
@@ -339,7 +393,7 @@ class Socket(zmq.Socket):
 
     async def asend(
         self,
-        data: bytes,
+        data: bytes | zmq.Frame,
         flags: int = 0,
         copy: bool = True,
         track: bool = False,
@@ -349,7 +403,14 @@ class Socket(zmq.Socket):
         kwargs["flags"] = flags
         kwargs["copy"] = copy
         kwargs["track"] = track
-        kwargs.update(dict(flags=flags, copy=copy, track=track))
+        if flags & zmq.DONTWAIT and not self._send_futures:
+            # short-circuit non-blocking calls, no Future needed
+            try:
+                return self._shadow_sock.send(data, **kwargs)
+            finally:
+                # schedule wake for recv if there are any receivers waiting
+                if self._recv_futures:
+                    self._schedule_remaining_events()
         return await self._add_send_event("send", msg=data, kwargs=kwargs)
 
     async def asend_json(
@@ -362,7 +423,14 @@ class Socket(zmq.Socket):
         for key in ("routing_id", "group"):
             if key in kwargs:
                 send_kwargs[key] = kwargs.pop(key)
-        msg = jsonapi.dumps(obj, **kwargs)
+        msg = _json_dumps(obj, **kwargs)
+        if len(msg) >= zmq.COPY_THRESHOLD:
+            # for large payloads, send without copying the bytes into the zmq
+            # message: the frame just keeps a reference to the (immutable)
+            # bytes object; below the threshold a memcpy is cheaper than the
+            # zero-copy bookkeeping
+            frame = zmq.Frame(msg, copy=False, track=False)
+            return await self.asend(frame, flags=flags, copy=False, **send_kwargs)
         return await self.asend(msg, flags=flags, **send_kwargs)
 
     async def asend_string(
@@ -446,10 +514,6 @@ class Socket(zmq.Socket):
             "send_multipart", msg=msg_parts, kwargs=kwargs
         )
 
-    def _deserialize(self, recvd, load):
-        """Deserialize with Futures"""
-        return load(recvd)
-
     async def apoll(self, timeout=None, flags=zmq.POLLIN) -> int:  # type: ignore
         """poll the socket for events
 
@@ -459,8 +523,11 @@ class Socket(zmq.Socket):
         if self.closed:
             raise zmq.ZMQError(zmq.ENOTSUP)
 
-        p = Poller()
-        p.register(self, flags)
+        p = self._poller_cache.get(flags)
+        if p is None:
+            p = Poller()
+            p.register(self, flags)
+            self._poller_cache[flags] = p
         assert self._task_group is not None
         poll_future = cast(
             Task,
@@ -534,86 +601,104 @@ class Socket(zmq.Socket):
 
         return create_task(call_later(), self._task_group)
 
-    @staticmethod
-    def _remove_finished_future(future, event_list, event=None):
-        """Make sure that futures are removed from the event list when they resolve
+    def _remove_finished_recv(self, future):
+        """Make sure that futures are removed from the recv columns when they resolve
 
-        Avoids delaying cleanup until the next send/recv event,
+        Avoids delaying cleanup until the next recv event,
         which may never come.
         """
-        # "future" instance is shared between sockets, but each socket has its own event list.
-        if not event_list:
-            return
+        # "future" instance is shared between sockets, but each socket has its own columns.
         # only unconsumed events (e.g. cancelled calls)
         # will be present when this happens
         try:
-            event_list.remove(event)
+            index = self._recv_futures.index(future)  # type: ignore[union-attr]
         except ValueError:
             # usually this will have been removed by being consumed
             return
+        for column in self._recv_columns:
+            del column[index]
 
-    async def _add_recv_event(self, kind, kwargs=None, future=None):
-        """Add a recv event, returning the corresponding Future"""
-        f = future or Future()
-        if kind.startswith("recv") and kwargs.get("flags", 0) & zmq.DONTWAIT:
-            # short-circuit non-blocking calls
-            recv = getattr(self._shadow_sock, kind)
-            try:
-                r = recv(**kwargs)
-            except Exception as e:
-                f.set_exception(e)
-            else:
-                f.set_result(r)
-            return await f.wait()
+    def _remove_finished_send(self, future):
+        """Make sure that futures are removed from the send columns when they resolve
+
+        Avoids delaying cleanup until the next send event,
+        which may never come.
+        """
+        try:
+            index = self._send_futures.index(future)  # type: ignore[union-attr]
+        except ValueError:
+            # usually this will have been removed by being consumed
+            return
+        for column in self._send_columns:
+            del column[index]
+
+    async def _add_recv_event(
+        self, kind, kwargs=None, future=None, _Future=Future, _POLLIN=POLLIN
+    ):
+        """Add a recv event, returning the corresponding Future
 
+        The trailing default arguments only alias module globals as
+        locals, to avoid global lookups on the per-message path.
+        """
+        f = future or _Future()
         timer = _NoTimer
-        if hasattr(zmq, "RCVTIMEO"):
+        if _HAS_RCVTIMEO:
             timeout_ms = self._shadow_sock.rcvtimeo
             if timeout_ms >= 0:
                 timer = self._add_timeout(f, timeout_ms * 1e-3)
 
         # we add it to the list of futures before we add the timeout as the
         # timeout will remove the future from recv_futures to avoid leaks
-        _future_event = _FutureEvent(f, kind, kwargs, msg=None, timer=timer)
-        self._recv_futures.append(_future_event)
+        self._recv_futures.append(f)
+        self._recv_kinds.append(kind)
+        self._recv_kwargs.append(kwargs)
+        self._recv_timers.append(timer)
 
-        if self._shadow_sock.get(EVENTS) & POLLIN:
+        events = self._shadow_sock.get(EVENTS)
+        if events & _POLLIN:
             # recv immediately, if we can
-            self._handle_recv()
-        if self._recv_futures and _future_event in self._recv_futures:
-            # Don't let the Future sit in _recv_events after it's done
+            self._handle_recv(events)
+        if self._recv_futures and f in self._recv_futures:
+            # Don't let the Future sit in _recv_futures after it's done
             # no need to register this if we've already been handled
             # (i.e. immediately-resolved recv)
-            f.add_done_callback(
-                partial(
-                    self._remove_finished_future,
-                    event_list=self._recv_futures,
-                    event=_future_event,
-                )
-            )
-            self._add_io_state(POLLIN)
+            f.add_done_callback(self._remove_finished_recv)
+            self._add_io_state(_POLLIN)
         return await f.wait()
 
-    async def _add_send_event(self, kind, msg=None, kwargs=None, future=None):
-        """Add a send event, returning the corresponding Future"""
-        f = future or Future()
+    async def _add_send_event(
+        self,
+        kind,
+        msg=None,
+        kwargs=None,
+        future=None,
+        _Future=Future,
+        _POLLOUT=POLLOUT,
+        _DONTWAIT=zmq.DONTWAIT,
+    ):
+        """Add a send event, returning the corresponding Future
+
+        The trailing default arguments only alias module globals as
+        locals, to avoid global lookups on the per-message path.
+        """
+        f = future or _Future()
         # attempt send with DONTWAIT if no futures are waiting
         # short-circuit for sends that will resolve immediately
         # only call if no send Futures are waiting
         if kind in ("send", "send_multipart") and not self._send_futures:
             flags = kwargs.get("flags", 0)
             nowait_kwargs = kwargs.copy()
-            nowait_kwargs["flags"] = flags | zmq.DONTWAIT
+            nowait_kwargs["flags"] = flags | _DONTWAIT
 
             # short-circuit non-blocking calls
-            send = getattr(self._shadow_sock, kind)
+            send = self._send_dispatch[kind]
             # track if the send resolved or not
             # (EAGAIN if DONTWAIT is not set should proceed with)
             finish_early = True
             try:
                 r = send(msg, **nowait_kwargs)
             except zmq.Again as e:
-                if flags & zmq.DONTWAIT:
+                if flags & _DONTWAIT:
                     f.set_exception(e)
                 else:
                     # EAGAIN raised and DONTWAIT not requested,
@@ -632,35 +717,41 @@ class Socket(zmq.Socket):
                 return await f.wait()
 
         timer = _NoTimer
-        if hasattr(zmq, "SNDTIMEO"):
+        if _HAS_SNDTIMEO:
             timeout_ms = self._shadow_sock.get(zmq.SNDTIMEO)
             if timeout_ms >= 0:
                 timer = self._add_timeout(f, timeout_ms * 1e-3)
 
         # we add it to the list of futures before we add the timeout as the
-        # timeout will remove the future from recv_futures to avoid leaks
-        _future_event = _FutureEvent(f, kind, kwargs=kwargs, msg=msg, timer=timer)
-        self._send_futures.append(_future_event)
+        # timeout will remove the future from send_futures to avoid leaks
+        self._send_futures.append(f)
+        self._send_kinds.append(kind)
+        self._send_msgs.append(msg)
+        self._send_kwargs.append(kwargs)
+        self._send_timers.append(timer)
         # Don't let the Future sit in _send_futures after it's done
-        f.add_done_callback(
-            partial(
-                self._remove_finished_future,
-                event_list=self._send_futures,
-                event=_future_event,
-            )
-        )
+        f.add_done_callback(self._remove_finished_send)
 
-        self._add_io_state(POLLOUT)
+        self._add_io_state(_POLLOUT)
         return await f.wait()
 
-    def _handle_recv(self):
-        """Handle recv events"""
-        if not self._shadow_sock.get(EVENTS) & POLLIN:
+    def _handle_recv(self, events=None, _POLLIN=POLLIN, _DONTWAIT=zmq.DONTWAIT):
+        """Handle recv events
+
+        `events` is the EVENTS mask the caller already read, to avoid
+        a second zmq call; when not given it is read here.
+        """
+        if events is None:
+            events = self._shadow_sock.get(EVENTS)
+        if not events & _POLLIN:
             # event triggered, but state may have been changed between trigger and callback
             return
         f = None
         while self._recv_futures:
-            f, kind, kwargs, _, timer = self._recv_futures.popleft()
+            f = self._recv_futures.popleft()
+            kind = self._recv_kinds.popleft()
+            kwargs = self._recv_kwargs.popleft()
+            timer = self._recv_timers.popleft()
             # skip any cancelled futures
             if f.done():
                 f = None
@@ -668,7 +759,7 @@ class Socket(zmq.Socket):
                 break
 
         if not self._recv_futures:
-            self._drop_io_state(POLLIN)
+            self._drop_io_state(_POLLIN)
 
         if f is None:
             return
@@ -679,14 +770,11 @@ class Socket(zmq.Socket):
             # on poll event, just signal ready, nothing else.
             f.set_result(None)
             return
-        elif kind == "recv_multipart":
-            recv = self._shadow_sock.recv_multipart
-        elif kind == "recv":
-            recv = self._shadow_sock.recv
-        else:
+        recv = self._recv_dispatch.get(kind)
+        if recv is None:
             raise ValueError(f"Unhandled recv event type: {kind!r}")
 
-        kwargs["flags"] |= zmq.DONTWAIT
+        kwargs["flags"] |= _DONTWAIT
         try:
             result = recv(**kwargs)
         except Exception as e:
@@ -694,13 +782,19 @@ class Socket(zmq.Socket):
         else:
             f.set_result(result)
 
-    def _handle_send(self):
-        if not self._shadow_sock.get(EVENTS) & POLLOUT:
+    def _handle_send(self, events=None, _POLLOUT=POLLOUT, _DONTWAIT=zmq.DONTWAIT):
+        if events is None:
+            events = self._shadow_sock.get(EVENTS)
+        if not events & _POLLOUT:
             # event triggered, but state may have been changed between trigger and callback
             return
         f = None
         while self._send_futures:
-            f, kind, kwargs, msg, timer = self._send_futures.popleft()
+            f = self._send_futures.popleft()
+            kind = self._send_kinds.popleft()
+            msg = self._send_msgs.popleft()
+            kwargs = self._send_kwargs.popleft()
+            timer = self._send_timers.popleft()
             # skip any cancelled futures
             if f.done():
                 f = None
@@ -708,7 +802,7 @@ class Socket(zmq.Socket):
                 break
 
         if not self._send_futures:
-            self._drop_io_state(POLLOUT)
+            self._drop_io_state(_POLLOUT)
 
         if f is None:
             return
@@ -719,14 +813,11 @@ class Socket(zmq.Socket):
             # on poll event, just signal ready, nothing else.
             f.set_result(None)
             return
-        elif kind == "send_multipart":
-            send = self._shadow_sock.send_multipart
-        elif kind == "send":
-            send = self._shadow_sock.send
-        else:
+        send = self._send_dispatch.get(kind)
+        if send is None:
             raise ValueError(f"Unhandled send event type: {kind!r}")
 
-        kwargs["flags"] |= zmq.DONTWAIT
+        kwargs["flags"] |= _DONTWAIT
         try:
             result = send(msg, **kwargs)
         except Exception as e:
@@ -736,16 +827,33 @@ class Socket(zmq.Socket):
 
     # event masking from ZMQStream
     async def _handle_events(self):
-        """Dispatch IO events to _handle_recv, etc."""
-        if self._shadow_sock.closed:
-            return
-
-        zmq_events = self._shadow_sock.get(EVENTS)
-        if zmq_events & zmq.POLLIN:
-            self._handle_recv()
-        if zmq_events & zmq.POLLOUT:
-            self._handle_send()
-        self._schedule_remaining_events()
+        """Dispatch IO events to _handle_recv, etc.
+
+        The zmq FD is edge-triggered, so all events still matching the
+        interest mask are drained here in a loop instead of scheduling a
+        new task per remaining event. Every _EVENTS_BATCH events the loop
+        re-schedules itself to let other tasks run. The EVENTS read at the
+        top of each iteration runs after the previous recv/send calls and
+        is what re-arms the edge-triggered FD.
+        """
+        count = 0
+        while not self._shadow_sock.closed:
+            zmq_events = self._shadow_sock.get(EVENTS)
+            if count and not zmq_events & self._state:
+                # no remaining events match the interest mask
+                return
+            if zmq_events & POLLIN:
+                self._handle_recv(zmq_events)
+            if zmq_events & POLLOUT:
+                self._handle_send(zmq_events)
+            if self._state == 0:
+                # not watching for anything, nothing to drain
+                return
+            count += 1
+            if count >= _EVENTS_BATCH:
+                # yield to the rest of the event loop before draining more
+                self._task_group.start_soon(self._handle_events)
+                return
 
     def _schedule_remaining_events(self, events=None):
         """Schedule a call to handle_events next loop iteration
@@ -816,10 +924,12 @@ class Socket(zmq.Socket):
             return
 
         self.started.set()
+        self._reader_scope = CancelScope()
         try:
-            while True:
-                await wait_readable(self._shadow_sock.FD)
-                await self._handle_events()
+            with self._reader_scope:
+                while not self._shadow_sock.closed:
+                    await wait_readable(self._fd)
+                    await self._handle_events()
         except Exception:
             pass
 
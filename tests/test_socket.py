@@ -1,4 +1,5 @@
 import json
+import math
 
 import pytest
 import zmq
@@ -179,6 +180,37 @@ async def test_recv_json(push_pull):
         assert recvd == obj
 
 
+async def test_recv_json_orjson_fallback(push_pull):
+    a, b = map(Socket, push_pull)
+    async with b, a:
+        # orjson rejects ints beyond 64 bits, jsonapi takes over
+        obj = {"big": 2**100}
+        f = b.arecv_json()
+        await a.asend_json(obj)
+        recvd = await f
+        assert recvd == obj
+
+
+async def test_recv_json_kwargs(push_pull):
+    a, b = map(Socket, push_pull)
+    async with b, a:
+        # json keyword arguments force the jsonapi path
+        f = b.arecv_json()
+        await a.asend_json({"x": {3, 1, 2}}, default=sorted)
+        recvd = await f
+        assert recvd == {"x": [1, 2, 3]}
+
+
+async def test_recv_json_nan(push_pull):
+    a, b = map(Socket, push_pull)
+    async with b, a:
+        # stdlib json emits a NaN token, which orjson cannot decode
+        f = b.arecv_json()
+        await a.asend_json(float("nan"), allow_nan=True)
+        recvd = await f
+        assert math.isnan(recvd)
+
+
 async def test_recv_json_cancelled(push_pull):
     async with create_task_group() as tg:
         a, b = map(Socket, push_pull)